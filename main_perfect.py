@@ -1,18 +1,44 @@
 import json
 import os
+import threading
+from contextlib import contextmanager
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QTableWidget, QTableWidgetItem, QPushButton,
     QLabel, QVBoxLayout, QHBoxLayout, QWidget, QDialog, QFormLayout,
     QSpinBox, QDateTimeEdit, QComboBox, QDialogButtonBox, QMessageBox,
     QFileDialog, QTextEdit
 )
-from PyQt5.QtCore import QDateTime, QStandardPaths
+from PyQt5.QtCore import Qt, QDateTime, QStandardPaths, QTimer, QThreadPool, QRunnable, QMetaObject
 from datetime import datetime
 import sys
-from PyQt5.QtGui import QColor
+from PyQt5.QtGui import QBrush, QColor
+
+try:
+    import orjson  # Optional, much faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+def json_dumps(data):
+    """Serialize data to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode("utf-8")
+
+def json_loads(raw):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 ### Booking Class
 class Booking:
+    __slots__ = (
+        "booking_id", "check_in", "check_out", "num_guests", "room_id", "is_paid",
+        "checkout_reason", "checkout_notes", "_fmt_in", "_fmt_out", "_status"
+    )
+
     def __init__(self, booking_id, check_in, num_guests, room_id, is_paid=False):
         self.booking_id = booking_id
         self.check_in = check_in
@@ -22,6 +48,31 @@ class Booking:
         self.is_paid = is_paid
         self.checkout_reason = None
         self.checkout_notes = None
+        self._fmt_in = None  # Display strings, computed on first use
+        self._fmt_out = None
+        self._status = None
+
+    def record_check_out(self, check_out_datetime, reason, notes):
+        """Mark the booking as checked out and drop display strings that changed."""
+        self.check_out = check_out_datetime
+        self.checkout_reason = reason
+        self.checkout_notes = notes
+        self._fmt_out = None
+        self._status = None
+
+    @property
+    def fmt_check_in(self):
+        """Check-in time formatted for display."""
+        if self._fmt_in is None:
+            self._fmt_in = self.check_in.strftime(DATETIME_FORMAT)
+        return self._fmt_in
+
+    @property
+    def fmt_check_out(self):
+        """Check-out time formatted for display, or N/A while checked in."""
+        if self._fmt_out is None:
+            self._fmt_out = self.check_out.strftime(DATETIME_FORMAT) if self.check_out else "N/A"
+        return self._fmt_out
 
     def to_dict(self):
         return {
@@ -45,118 +96,399 @@ class Booking:
             room_id=data["room_id"],
             is_paid=data.get("is_paid", False)
         )
-        booking.check_out = datetime.fromisoformat(data["check_out"]) if data["check_out"] else None
-        booking.checkout_reason = data.get("checkout_reason")
-        booking.checkout_notes = data.get("checkout_notes")
+        booking.record_check_out(
+            datetime.fromisoformat(data["check_out"]) if data["check_out"] else None,
+            data.get("checkout_reason"),
+            data.get("checkout_notes")
+        )
         return booking
 
     def checkout_status(self):
         """Determine checkout status with more detailed information."""
-        if self.check_out:
-            status = f"Checked out ({self.checkout_reason})"
-            if self.checkout_reason == "Emergency" and self.checkout_notes:
-                status += f": {self.checkout_notes}"
-            return status
-        return "Currently checked in"
+        if self._status is None:
+            if self.check_out:
+                status = f"Checked out ({self.checkout_reason})"
+                if self.checkout_reason == "Emergency" and self.checkout_notes:
+                    status += f": {self.checkout_notes}"
+                self._status = status
+            else:
+                self._status = "Currently checked in"
+        return self._status
+
+### SaveTask Class
+class SaveTask(QRunnable):
+    """Write a prepared data snapshot to disk on a worker thread."""
+    def __init__(self, manager, filename, data):
+        super().__init__()
+        self.manager = manager
+        self.filename = filename
+        self.data = data
+
+    def run(self):
+        self.manager._complete_save(self.filename, self.data)
 
 ### HotelManager Class
 class HotelManager:
-    def __init__(self):
+    SAVE_DELAY_MS = 500  # Saves requested within this window are coalesced into one write
+    COMPACT_EVERY = 100  # Logged events before the snapshot is rewritten and the log truncated
+    _ALL_ROOMS = frozenset(range(1, 51))  # Room numbers 1 to 50
+
+    def __init__(self, autosave=True):
         self.bookings = []
         self.next_id = 1
-        self.available_rooms = list(range(1, 51))  # Room numbers 1 to 50
-        self.maintenance_rooms = []  # Rooms under maintenance
+        self.available_rooms = set(self._ALL_ROOMS)
+        self.maintenance_rooms = set()  # Rooms under maintenance
+        self._by_id = {}  # booking_id -> Booking
+        self._open = {}  # booking_id -> Booking, checked-in bookings only, in check-in order
+        self._total_guests = 0  # Guests in current bookings, kept up to date by every mutation
+        self.autosave = autosave  # Persist after every mutation; disable for bulk work and call commit()
+        self._dirty = False  # Unsaved changes pending
+        self._save_timer = None  # Created on first use, needs a running Qt event loop
+        self._save_lock = threading.Lock()  # Serializes file writes across threads
+        self._save_pending = False  # A background snapshot write is in flight
+        self._save_pool = QThreadPool()  # Dedicated to snapshot writes, one at a time
+        self._save_pool.setMaxThreadCount(1)
+        self._log_file = None  # Append-only event log, opened on first event
+        self._rotated_log_pending = False  # The .old log holds events no snapshot on disk covers yet
+        self._events_since_snapshot = 0
+        self._replaying = False  # Set while replaying the event log on startup
+        self._suspend_save = 0  # Nesting depth of bulk() blocks
+        self._pending_events = []  # Encoded events held back until the outermost bulk() exits
 
     def check_in(self, num_guests, check_in_datetime, room_id, is_paid=False):
-        """Add a new booking."""
+        """Add a new booking and return it."""
         if room_id not in self.available_rooms or room_id in self.maintenance_rooms:
             raise ValueError("Room ID is not available.")
         
         booking = Booking(self.next_id, check_in_datetime, num_guests, room_id, is_paid)
         self.bookings.append(booking)
-        self.available_rooms.remove(room_id)  # Mark room as booked
+        self._by_id[booking.booking_id] = booking
+        self._open[booking.booking_id] = booking
+        self._total_guests += num_guests
+        self.available_rooms.discard(room_id)  # Mark room as booked
         self.next_id += 1
         
-        self.save_data(self.get_default_data_path())  # Save data after each operation
+        self._append_event({
+            "op": "check_in",
+            "booking_id": booking.booking_id,
+            "check_in": check_in_datetime.isoformat(),
+            "num_guests": num_guests,
+            "room_id": room_id,
+            "is_paid": is_paid
+        })
+        return booking
 
     def check_out(self, booking_id, check_out_datetime, reason="Normal", notes=None):
         """Check out a booking with reason and optional notes."""
-        for booking in self.bookings:
-            if booking.booking_id == booking_id:
-                if booking.check_out is None and check_out_datetime > booking.check_in:
-                    booking.check_out = check_out_datetime
-                    booking.checkout_reason = reason
-                    booking.checkout_notes = notes
-                    self.available_rooms.append(booking.room_id)
-                    self.save_data(self.get_default_data_path())
-                    return True
-                return False
-        return False
+        booking = self._open.get(booking_id)
+        if booking is None or check_out_datetime <= booking.check_in:
+            return False
+        del self._open[booking_id]
+        booking.record_check_out(check_out_datetime, reason, notes)
+        self._total_guests -= booking.num_guests
+        self.available_rooms.add(booking.room_id)
+        self._append_event({
+            "op": "check_out",
+            "booking_id": booking_id,
+            "check_out": check_out_datetime.isoformat(),
+            "reason": reason,
+            "notes": notes
+        })
+        return True
 
     def mark_room_under_maintenance(self, room_id):
-        """Mark a room as under maintenance."""
-        if room_id in self.available_rooms:
+        """Mark a room as under maintenance. Return False if the room is not available."""
+        try:
             self.available_rooms.remove(room_id)
-            self.maintenance_rooms.append(room_id)
-            self.save_data(self.get_default_data_path())
+        except KeyError:
+            return False
+        self.maintenance_rooms.add(room_id)
+        self._append_event({"op": "maintenance", "room_id": room_id})
+        return True
 
     def mark_room_repaired(self, room_id):
-        """Mark a room as repaired."""
-        if room_id in self.maintenance_rooms:
+        """Mark a room as repaired. Return False if the room is not under maintenance."""
+        try:
             self.maintenance_rooms.remove(room_id)
-            self.available_rooms.append(room_id)
-            self.save_data(self.get_default_data_path())
+        except KeyError:
+            return False
+        self.available_rooms.add(room_id)
+        self._append_event({"op": "repaired", "room_id": room_id})
+        return True
+
+    def get_booking(self, booking_id):
+        """Return the booking with the given ID, or None if there is none."""
+        return self._by_id.get(booking_id)
 
     def get_current_bookings(self):
         """Return a list of current bookings."""
-        return [b for b in self.bookings if b.check_out is None]
+        return list(self._open.values())
+
+    def get_current_booking_ids(self):
+        """Return the IDs of current bookings as strings, built on each call from the open-bookings index."""
+        return [str(booking_id) for booking_id in self._open]
 
     def get_checked_out_bookings(self):
         """Return a list of checked-out bookings."""
         return [b for b in self.bookings if b.check_out is not None]
 
     def get_total_guests(self):
-        """Calculate total guests staying."""
-        return sum(b.num_guests for b in self.get_current_bookings())
+        """Return total guests staying."""
+        return self._total_guests
 
     def get_available_rooms(self):
         """Return available room IDs."""
         return self.available_rooms
 
     def get_unavailable_rooms(self):
-        """Return unavailable room IDs."""
-        return [b.room_id for b in self.bookings if b.check_out is None] + self.maintenance_rooms
+        """Return unavailable (booked or under maintenance) room IDs."""
+        return sorted(self._ALL_ROOMS - self.available_rooms)
 
     def get_default_data_path(self):
         """Get the default path for saving data."""
         docs_path = QStandardPaths.writableLocation(QStandardPaths.DocumentsLocation)
         return os.path.join(docs_path, "hotel_data.json")
 
-    def save_data(self, filename):
-        """Save bookings to a JSON file."""
-        data = {
+    def get_default_log_path(self):
+        """Get the default path of the event log that accompanies the data file."""
+        docs_path = QStandardPaths.writableLocation(QStandardPaths.DocumentsLocation)
+        return os.path.join(docs_path, "hotel_events.log")
+
+    def _append_event(self, event):
+        """Record a mutation, appending it as one JSON line to the event log if autosave is on."""
+        self._dirty = True
+        if self._replaying or not self.autosave:
+            return
+        self._pending_events.append(json_dumps(event) + b"\n")
+        if self._suspend_save == 0:
+            self._write_pending_events()
+
+    def _write_pending_events(self):
+        """Append all buffered events to the event log with a single write."""
+        events = self._pending_events
+        self._pending_events = []
+        try:
+            if self._log_file is None:
+                self._log_file = open(self.get_default_log_path(), 'ab')
+            self._log_file.write(b"".join(events))
+            self._log_file.flush()
+        except Exception as e:
+            print(f"Error writing event log: {e}")
+        self._events_since_snapshot += len(events)
+        if self._events_since_snapshot >= self.COMPACT_EVERY:
+            self.schedule_save()
+
+    @contextmanager
+    def bulk(self):
+        """Group several mutations so their events are written to the log together on exit.
+
+        Usage: ``with manager.bulk(): ...``. Blocks may be nested; only the outermost one writes.
+        """
+        self._suspend_save += 1
+        try:
+            yield self
+        finally:
+            self._suspend_save -= 1
+            if self._suspend_save == 0 and self._pending_events:
+                self._write_pending_events()
+
+    def _rotate_log(self):
+        """Move the live event log aside so events logged from now on start a fresh file."""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+        log_path = self.get_default_log_path()
+        rotated_path = log_path + ".old"
+        try:
+            if not os.path.exists(log_path):
+                return
+            if self._rotated_log_pending and os.path.exists(rotated_path):
+                # An earlier snapshot failed, keep its events in front of ours
+                with open(log_path, 'rb') as src, open(rotated_path, 'ab') as dst:
+                    dst.write(src.read())
+                os.remove(log_path)
+            else:
+                os.replace(log_path, rotated_path)  # Replaces a stale .old already covered by a snapshot
+            self._rotated_log_pending = True
+        except Exception as e:
+            print(f"Error rotating event log: {e}")
+
+    def _complete_save(self, filename, data):
+        """Write a snapshot taken right after _rotate_log and drop the events it now covers."""
+        if self._write_data(filename, data):
+            self._rotated_log_pending = False  # Covered now, even if removing it below fails
+            try:
+                os.remove(self.get_default_log_path() + ".old")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Error removing event log: {e}")
+            self._save_pending = False
+            return True
+        self._dirty = True
+        self._save_pending = False
+        if self._save_timer is not None:
+            # May run on the pool thread, so restart the timer from its own (GUI) thread
+            QMetaObject.invokeMethod(self._save_timer, "start", Qt.QueuedConnection)
+        return False
+
+    def schedule_save(self):
+        """Debounce saves so a burst of mutations results in a single background write."""
+        self._dirty = True
+        if self._save_timer is None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.setInterval(self.SAVE_DELAY_MS)
+            self._save_timer.timeout.connect(self._save_in_background)
+        self._save_timer.start()
+
+    def _save_in_background(self):
+        """Snapshot the current state and hand the file write to the thread pool."""
+        if not self._dirty:
+            return
+        if self._save_pending:
+            self._save_timer.start()  # Try again once the previous write is done
+            return
+        data = self._snapshot()
+        self._rotate_log()
+        self._dirty = False
+        self._events_since_snapshot = 0
+        self._save_pending = True
+        self._save_pool.start(SaveTask(self, self.get_default_data_path(), data))
+
+    def flush(self):
+        """Cancel any pending background save and write outstanding changes now."""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        return self.commit()
+
+    def commit(self):
+        """Write all pending changes to the default data file and truncate the event log."""
+        if self._save_pending:
+            self._save_pool.waitForDone()
+        if not self._dirty:
+            return True
+        data = self._snapshot()
+        self._rotate_log()
+        self._dirty = False
+        self._events_since_snapshot = 0
+        return self._complete_save(self.get_default_data_path(), data)
+
+    def restore(self):
+        """Load the last snapshot from the default location and replay the events logged since."""
+        default_path = self.get_default_data_path()
+        if os.path.exists(default_path):
+            self.load_data(default_path)
+        log_path = self.get_default_log_path()
+        # Whether a leftover .old predates the snapshot is unknown, so keep it until the next one
+        self._rotated_log_pending = os.path.exists(log_path + ".old")
+        self._replay_log(log_path + ".old")
+        self._replay_log(log_path)
+
+    def _replay_log(self, filename):
+        """Apply every event in a log file; events already in the snapshot are no-ops."""
+        try:
+            with open(filename, 'rb') as file:
+                lines = file.read().splitlines()
+        except FileNotFoundError:
+            return
+        self._replaying = True
+        try:
+            for line in lines:
+                try:
+                    self._apply_event(json_loads(line))
+                    self._events_since_snapshot += 1
+                except (KeyError, ValueError) as e:
+                    print(f"Skipping event log entry: {e}")
+        finally:
+            self._replaying = False
+
+    def _apply_event(self, event):
+        """Re-run the mutation described by a logged event."""
+        op = event["op"]
+        if op == "check_in":
+            if event["booking_id"] < self.next_id:
+                return  # Already part of the snapshot
+            self.next_id = event["booking_id"]
+            self.check_in(event["num_guests"], datetime.fromisoformat(event["check_in"]),
+                          event["room_id"], event["is_paid"])
+        elif op == "check_out":
+            self.check_out(event["booking_id"], datetime.fromisoformat(event["check_out"]),
+                           event["reason"], event["notes"])
+        elif op == "maintenance":
+            self.mark_room_under_maintenance(event["room_id"])
+        elif op == "repaired":
+            self.mark_room_repaired(event["room_id"])
+        elif op == "clear_checked_out":
+            self._remove_checked_out(event["booking_ids"])
+        else:
+            raise ValueError(f"Unknown event {op!r}")
+
+    def _snapshot(self):
+        """Return a copy of the current state that is safe to serialize on another thread."""
+        return {
             "next_id": self.next_id,
-            "available_rooms": self.available_rooms,
-            "maintenance_rooms": self.maintenance_rooms,
+            "available_rooms": sorted(self.available_rooms),
+            "maintenance_rooms": sorted(self.maintenance_rooms),
             "bookings": [booking.to_dict() for booking in self.bookings]
         }
+
+    def _write_data(self, filename, data):
+        """Atomically write a compact snapshot to a JSON file."""
+        tmp_filename = filename + ".tmp"
         try:
-            with open(filename, 'w') as file:
-                json.dump(data, file, indent=4)
+            with self._save_lock:
+                with open(tmp_filename, 'wb') as file:
+                    file.write(json_dumps(data))
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(tmp_filename, filename)  # Readers never see a half-written file
             return True
         except Exception as e:
             print(f"Error saving data: {e}")
             return False
 
+    def save_data(self, filename):
+        """Save bookings to a JSON file."""
+        return self._write_data(filename, self._snapshot())
+
+    def export_pretty(self, filename):
+        """Save bookings to an indented, human-readable JSON file."""
+        try:
+            with open(filename, 'w') as file:
+                json.dump(self._snapshot(), file, indent=4)
+            return True
+        except Exception as e:
+            print(f"Error exporting data: {e}")
+            return False
+
+    def import_data(self, filename):
+        """Replace the current state with a JSON file and make it the saved state.
+
+        An invalid file is rejected before anything is committed.
+        """
+        self.flush()
+        if not self.load_data(filename):
+            return False
+        self._dirty = True
+        self.commit()
+        return True
+
     def load_data(self, filename):
-        """Load bookings from a JSON file."""
+        """Load bookings from a JSON file. The current state is left untouched if the file is invalid."""
         try:
-            with open(filename, 'r') as file:
-                data = json.load(file)
+            with open(filename, 'rb') as file:
+                data = json_loads(file.read())
+                bookings = [Booking.from_dict(b) for b in data.get("bookings", [])]
+                available_rooms = set(data.get("available_rooms", self._ALL_ROOMS))
+                maintenance_rooms = set(data.get("maintenance_rooms", []))
                 self.next_id = data.get("next_id", 1)
-                self.available_rooms = data.get("available_rooms", list(range(1, 51)))
-                self.maintenance_rooms = data.get("maintenance_rooms", [])
-                self.bookings = [Booking.from_dict(b) for b in data.get("bookings", [])]
+                self.available_rooms = available_rooms
+                self.maintenance_rooms = maintenance_rooms
+                self.bookings = bookings
+                self._by_id = {b.booking_id: b for b in self.bookings}
+                self._open = {b.booking_id: b for b in self.bookings if b.check_out is None}
+                self._total_guests = sum(b.num_guests for b in self._open.values())
             return True
         except FileNotFoundError:
             print("No data file found. Starting with empty data.")
@@ -167,11 +499,19 @@ class HotelManager:
 
     def clear_checked_out_bookings(self):
         """Remove all checked-out bookings while keeping active ones."""
-        checked_out_bookings = self.get_checked_out_bookings()
-        for booking in checked_out_bookings:
-            self.bookings.remove(booking)
-        self.save_data(self.get_default_data_path())
-        return len(checked_out_bookings)
+        booking_ids = [b.booking_id for b in self.get_checked_out_bookings()]
+        if booking_ids:
+            self._remove_checked_out(booking_ids)
+            self._append_event({"op": "clear_checked_out", "booking_ids": booking_ids})
+        return len(booking_ids)
+
+    def _remove_checked_out(self, booking_ids):
+        """Remove the given bookings if they are checked out; other IDs are ignored."""
+        removed = {i for i in booking_ids if i in self._by_id and self._by_id[i].check_out is not None}
+        if removed:
+            self.bookings = [b for b in self.bookings if b.booking_id not in removed]
+            for booking_id in removed:
+                del self._by_id[booking_id]
 
     def save_to_txt(self):
         """Save current data to a text file."""
@@ -179,27 +519,36 @@ class HotelManager:
             docs_path = QStandardPaths.writableLocation(QStandardPaths.DocumentsLocation)
             file_path = os.path.join(docs_path, "hotel_report.txt")
             
+            # Gather everything the report needs once up front
+            current_bookings = self.get_current_bookings()
+            booked_count = len(current_bookings)
+            total_guests = self.get_total_guests()
+            # Build the whole report in memory and write it in one call
+            parts = [
+                "=== Hotel Management System Report ===\n",
+                f"Generated on: {datetime.now().strftime(DATETIME_FORMAT)}\n\n",
+                "== Current Bookings ==\n"
+            ]
+            if current_bookings:
+                parts.extend(
+                    f"ID: {booking.booking_id}, Room: {booking.room_id}, Guests: {booking.num_guests}, "
+                    f"Check-in: {booking.fmt_check_in}, "
+                    f"Paid: {'Yes' if booking.is_paid else 'No'}\n"
+                    for booking in current_bookings
+                )
+            else:
+                parts.append("No current bookings\n")
+            
+            parts.append("\n== Room Status ==\n")
+            parts.append(f"Available rooms: {len(self.available_rooms)}\n")
+            parts.append(f"Booked rooms: {booked_count}\n")
+            parts.append(f"Maintenance rooms: {len(self.maintenance_rooms)}\n")
+            
+            parts.append("\n== Statistics ==\n")
+            parts.append(f"Total guests currently staying: {total_guests}\n")
+            
             with open(file_path, 'w') as file:
-                file.write("=== Hotel Management System Report ===\n")
-                file.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                file.write("== Current Bookings ==\n")
-                current_bookings = self.get_current_bookings()
-                if current_bookings:
-                    for booking in current_bookings:
-                        file.write(f"ID: {booking.booking_id}, Room: {booking.room_id}, Guests: {booking.num_guests}, "
-                                 f"Check-in: {booking.check_in.strftime('%Y-%m-%d %H:%M:%S')}, "
-                                 f"Paid: {'Yes' if booking.is_paid else 'No'}\n")
-                else:
-                    file.write("No current bookings\n")
-                
-                file.write("\n== Room Status ==\n")
-                file.write(f"Available rooms: {len(self.available_rooms)}\n")
-                file.write(f"Booked rooms: {len([b for b in self.bookings if b.check_out is None])}\n")
-                file.write(f"Maintenance rooms: {len(self.maintenance_rooms)}\n")
-                
-                file.write("\n== Statistics ==\n")
-                file.write(f"Total guests currently staying: {self.get_total_guests()}\n")
+                file.write("".join(parts))
             
             return file_path
         except Exception as e:
@@ -208,6 +557,12 @@ class HotelManager:
 
 ### MainWindow Class
 class MainWindow(QMainWindow):
+    # Row backgrounds, shared by every table cell
+    BRUSH_CHECKED_OUT = QBrush(QColor(220, 220, 220))  # Gray for checked-out bookings
+    BRUSH_PAID = QBrush(QColor(200, 255, 200))  # Light green for paid current bookings
+    BRUSH_UNPAID = QBrush(QColor(255, 200, 200))  # Light red for unpaid current bookings
+    BRUSH_EMERGENCY = QBrush(QColor(255, 255, 150))  # Yellow for emergency checkouts
+
     def __init__(self, manager, parent=None):
         super().__init__(parent)
         self.manager = manager
@@ -248,6 +603,13 @@ class MainWindow(QMainWindow):
         self.table.setHorizontalHeaderLabels(["ID", "Check-in", "Check-out", "Guests", "Room ID", "Paid", "Status"])
         self.table.horizontalHeader().setStretchLastSection(True)
         layout.addWidget(self.table)
+        self._row_for_id = {}  # booking_id -> table row
+
+        # Dialogs are built on first use and reused afterwards
+        self._check_in_dialog = None
+        self._check_out_dialog = None
+        self._maintenance_dialog = None
+        self._repaired_dialog = None
 
         # Label to show total guests
         self.total_label = QLabel(self)
@@ -271,36 +633,44 @@ class MainWindow(QMainWindow):
         self.refresh_table()
         self.refresh_total_guests()
 
+    def closeEvent(self, event):
+        """Make sure pending changes reach the disk before the window closes."""
+        self.manager.flush()
+        super().closeEvent(event)
+
     def load_initial_data(self):
         """Load data from default location on startup."""
-        default_path = self.manager.get_default_data_path()
-        if os.path.exists(default_path):
-            self.manager.load_data(default_path)
+        self.manager.restore()
 
     def open_check_in_dialog(self):
         """Open the check-in dialog and process the input if accepted."""
-        dialog = CheckInDialog(self)
+        if self._check_in_dialog is None:
+            self._check_in_dialog = CheckInDialog(self)
+        dialog = self._check_in_dialog
+        dialog.reset()
         if dialog.exec_() == QDialog.Accepted:
             num_guests = dialog.get_num_guests()
             check_in_dt = dialog.get_check_in_datetime()
             room_id = dialog.get_room_id()
             is_paid = dialog.get_payment_status()
             try:
-                self.manager.check_in(num_guests, check_in_dt, room_id, is_paid)
-                self.refresh_table()
+                booking = self.manager.check_in(num_guests, check_in_dt, room_id, is_paid)
+                self.add_booking_row(booking)
                 self.refresh_total_guests()
             except ValueError as e:
                 QMessageBox.warning(self, "Room Unavailable", str(e))
 
     def open_check_out_dialog(self):
         """Open the enhanced check-out dialog."""
-        current_bookings = self.manager.get_current_bookings()
-        if not current_bookings:
+        booking_ids = self.manager.get_current_booking_ids()
+        if not booking_ids:
             QMessageBox.information(self, "No Bookings", "There are no current bookings to check out.")
             return
         
-        booking_ids = [str(b.booking_id) for b in current_bookings]
-        dialog = EnhancedCheckOutDialog(booking_ids, self)
+        if self._check_out_dialog is None:
+            self._check_out_dialog = EnhancedCheckOutDialog(self)
+        dialog = self._check_out_dialog
+        dialog.reset(booking_ids)
         
         if dialog.exec_() == QDialog.Accepted:
             selected_id = int(dialog.get_selected_booking_id())
@@ -309,7 +679,7 @@ class MainWindow(QMainWindow):
             notes = dialog.get_checkout_notes()
             
             if self.manager.check_out(selected_id, check_out_dt, reason, notes):
-                self.refresh_table()
+                self.update_booking_row(selected_id)
                 self.refresh_total_guests()
             else:
                 QMessageBox.warning(self, "Check-out Failed", 
@@ -327,22 +697,24 @@ class MainWindow(QMainWindow):
 
     def open_maintenance_dialog(self):
         """Open a dialog to mark a room under maintenance."""
-        dialog = MaintenanceDialog(self.manager, self)
-        dialog.exec_()
-        self.refresh_table()
+        if self._maintenance_dialog is None:
+            self._maintenance_dialog = MaintenanceDialog(self.manager, self)
+        self._maintenance_dialog.reset()
+        self._maintenance_dialog.exec_()
 
     def open_repaired_dialog(self):
         """Open a dialog to mark a room as repaired."""
-        dialog = RepairedDialog(self.manager, self)
-        dialog.exec_()
-        self.refresh_table()
+        if self._repaired_dialog is None:
+            self._repaired_dialog = RepairedDialog(self.manager, self)
+        self._repaired_dialog.reset()
+        self._repaired_dialog.exec_()
 
     def save_data(self):
         """Save current data to a file."""
         default_path = self.manager.get_default_data_path()
         filename, _ = QFileDialog.getSaveFileName(self, "Save Data", default_path, "JSON Files (*.json)")
         if filename:
-            if self.manager.save_data(filename):
+            if self.manager.export_pretty(filename):
                 QMessageBox.information(self, "Save Data", "Data saved successfully.")
             else:
                 QMessageBox.warning(self, "Save Data", "Failed to save data.")
@@ -352,7 +724,7 @@ class MainWindow(QMainWindow):
         default_path = self.manager.get_default_data_path()
         filename, _ = QFileDialog.getOpenFileName(self, "Load Data", default_path, "JSON Files (*.json)")
         if filename:
-            if self.manager.load_data(filename):
+            if self.manager.import_data(filename):
                 self.refresh_table()
                 self.refresh_total_guests()
                 QMessageBox.information(self, "Load Data", "Data loaded successfully.")
@@ -361,7 +733,8 @@ class MainWindow(QMainWindow):
 
     def clear_checked_out_data(self):
         """Clear all checked-out bookings after confirmation."""
-        checked_out_count = len(self.manager.get_checked_out_bookings())
+        checked_out_ids = [b.booking_id for b in self.manager.get_checked_out_bookings()]
+        checked_out_count = len(checked_out_ids)
         
         if checked_out_count == 0:
             QMessageBox.information(self, "No Checked-Out Bookings", 
@@ -376,7 +749,7 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             cleared_count = self.manager.clear_checked_out_bookings()
-            self.refresh_table()
+            self.remove_booking_rows(checked_out_ids)
             QMessageBox.information(
                 self, "Cleared Checked-Out Bookings",
                 f"Successfully cleared {cleared_count} checked-out bookings."
@@ -391,43 +764,87 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.warning(self, "Error", "Failed to generate report.")
 
+    def add_booking_row(self, booking):
+        """Append a row for a newly checked-in booking."""
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        self._fill_row(row, booking)
+        self._row_for_id[booking.booking_id] = row
+
+    def update_booking_row(self, booking_id):
+        """Refresh the cells of a booking that has just been checked out."""
+        row = self._row_for_id.get(booking_id)
+        booking = self.manager.get_booking(booking_id)
+        if row is None or booking is None:
+            self.refresh_table()
+            return
+        self.table.item(row, 2).setText(booking.fmt_check_out)
+        self.table.item(row, 6).setText(booking.checkout_status())
+        brush = self._row_brush(booking)
+        for col in range(self.table.columnCount()):
+            self.table.item(row, col).setBackground(brush)
+
+    def remove_booking_rows(self, booking_ids):
+        """Remove the rows of cleared bookings, keeping the remaining rows as they are."""
+        rows = sorted((self._row_for_id[i] for i in booking_ids if i in self._row_for_id), reverse=True)
+        self.table.setUpdatesEnabled(False)
+        try:
+            for row in rows:
+                self.table.removeRow(row)
+        finally:
+            self.table.setUpdatesEnabled(True)
+        self._row_for_id = {b.booking_id: row for row, b in enumerate(self.manager.bookings)}
+
     def refresh_table(self):
-        """Update the table with all bookings, highlighting current ones."""
+        """Rebuild the table with all bookings, highlighting current ones."""
+        # Suspend repaints, sorting and signals while the rows are rebuilt
+        self.table.setUpdatesEnabled(False)
+        sorting_enabled = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            self._fill_table()
+        finally:
+            self.table.blockSignals(False)
+            self.table.setSortingEnabled(sorting_enabled)
+            self.table.setUpdatesEnabled(True)
+
+    def _fill_table(self):
+        """Write every booking into a table preallocated to the right size."""
         self.table.setRowCount(0)
+        self.table.setRowCount(len(self.manager.bookings))
+        self._row_for_id = {}
         
-        for booking in self.manager.bookings:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            check_out_time = booking.check_out.strftime("%Y-%m-%d %H:%M:%S") if booking.check_out else "N/A"
-            
-            items = [
-                QTableWidgetItem(str(booking.booking_id)),
-                QTableWidgetItem(booking.check_in.strftime("%Y-%m-%d %H:%M:%S")),
-                QTableWidgetItem(check_out_time),
-                QTableWidgetItem(str(booking.num_guests)),
-                QTableWidgetItem(str(booking.room_id)),
-                QTableWidgetItem("Yes" if booking.is_paid else "No"),
-                QTableWidgetItem(booking.checkout_status())
-            ]
-            
-            for col, item in enumerate(items):
-                self.table.setItem(row, col, item)
-                
-                # Color coding
-                if booking.check_out:
-                    # Gray for checked-out bookings
-                    item.setBackground(QColor(220, 220, 220))
-                elif booking.is_paid:
-                    # Light green for paid current bookings
-                    item.setBackground(QColor(200, 255, 200))
-                else:
-                    # Light red for unpaid current bookings
-                    item.setBackground(QColor(255, 200, 200))
-                
-                # Highlight emergency checkouts
-                if booking.checkout_reason == "Emergency":
-                    item.setBackground(QColor(255, 255, 150))  # Yellow for emergency
+        for row, booking in enumerate(self.manager.bookings):
+            self._fill_row(row, booking)
+            self._row_for_id[booking.booking_id] = row
+
+    def _fill_row(self, row, booking):
+        """Create the cells of one table row."""
+        items = [
+            QTableWidgetItem(str(booking.booking_id)),
+            QTableWidgetItem(booking.fmt_check_in),
+            QTableWidgetItem(booking.fmt_check_out),
+            QTableWidgetItem(str(booking.num_guests)),
+            QTableWidgetItem(str(booking.room_id)),
+            QTableWidgetItem("Yes" if booking.is_paid else "No"),
+            QTableWidgetItem(booking.checkout_status())
+        ]
+        
+        brush = self._row_brush(booking)
+        for col, item in enumerate(items):
+            item.setBackground(brush)
+            self.table.setItem(row, col, item)
+
+    def _row_brush(self, booking):
+        """Pick the background color for a booking's row."""
+        if booking.checkout_reason == "Emergency":
+            return self.BRUSH_EMERGENCY
+        if booking.check_out:
+            return self.BRUSH_CHECKED_OUT
+        if booking.is_paid:
+            return self.BRUSH_PAID
+        return self.BRUSH_UNPAID
 
     def refresh_total_guests(self):
         """Update the total guests label."""
@@ -454,14 +871,17 @@ class MaintenanceDialog(QDialog):
         button_box.accepted.connect(self.mark_room)
         button_box.rejected.connect(self.reject)
 
+    def reset(self):
+        """Restore the default input before the dialog is shown again."""
+        self.room_id_spin.setValue(1)
+
     def mark_room(self):
         """Mark the selected room as under maintenance."""
         room_id = self.room_id_spin.value()
-        if room_id not in self.manager.available_rooms:
+        if not self.manager.mark_room_under_maintenance(room_id):
             QMessageBox.warning(self, "Error","This room is not available for maintenance (may already be booked or in maintenance).")
             return
             
-        self.manager.mark_room_under_maintenance(room_id)
         QMessageBox.information(self, "Room Maintenance", f"Room {room_id} is now under maintenance.")
         self.accept()
 
@@ -485,14 +905,17 @@ class RepairedDialog(QDialog):
         button_box.accepted.connect(self.mark_room)
         button_box.rejected.connect(self.reject)
 
+    def reset(self):
+        """Restore the default input before the dialog is shown again."""
+        self.room_id_spin.setValue(1)
+
     def mark_room(self):
         """Mark the selected room as repaired."""
         room_id = self.room_id_spin.value()
-        if room_id not in self.manager.maintenance_rooms:
+        if not self.manager.mark_room_repaired(room_id):
             QMessageBox.warning(self, "Error", "This room is not under maintenance.")
             return
             
-        self.manager.mark_room_repaired(room_id)
         QMessageBox.information(self, "Room Repaired", f"Room {room_id} is now available.")
         self.accept()
 
@@ -532,14 +955,20 @@ class CheckInDialog(QDialog):
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
 
+    def reset(self):
+        """Restore the default inputs before the dialog is shown again."""
+        self.num_guests_spin.setValue(1)
+        self.check_in_datetime_edit.setDateTime(QDateTime.currentDateTime())
+        self.room_id_spin.setValue(1)
+        self.payment_status_combo.setCurrentIndex(0)
+
     def get_num_guests(self):
         """Return the number of guests entered."""
         return self.num_guests_spin.value()
 
     def get_check_in_datetime(self):
         """Return the check-in datetime as a Python datetime object."""
-        qdt = self.check_in_datetime_edit.dateTime()
-        return datetime.fromtimestamp(qdt.toMSecsSinceEpoch() / 1000)
+        return self.check_in_datetime_edit.dateTime().toPyDateTime()
 
     def get_room_id(self):
         """Return the room ID entered."""
@@ -551,14 +980,13 @@ class CheckInDialog(QDialog):
 
 ### EnhancedCheckOutDialog Class
 class EnhancedCheckOutDialog(QDialog):
-    def __init__(self, booking_ids, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Check Out")
         layout = QFormLayout(self)
 
-        # Booking selection
+        # Booking selection, filled by reset()
         self.booking_combo = QComboBox(self)
-        self.booking_combo.addItems(booking_ids)
         layout.addRow("Select booking:", self.booking_combo)
 
         # Check-out time input
@@ -588,6 +1016,14 @@ class EnhancedCheckOutDialog(QDialog):
         button_box.accepted.connect(self.validate)
         button_box.rejected.connect(self.reject)
 
+    def reset(self, booking_ids):
+        """Load the current booking IDs and restore the default inputs."""
+        self.booking_combo.clear()
+        self.booking_combo.addItems(booking_ids)
+        self.check_out_datetime_edit.setDateTime(QDateTime.currentDateTime())
+        self.reason_combo.setCurrentIndex(0)  # Also hides the notes field
+        self.notes_edit.clear()
+
     def toggle_notes_field(self, reason):
         """Show/hide notes field based on reason selection."""
         if reason == "Emergency":
@@ -608,8 +1044,7 @@ class EnhancedCheckOutDialog(QDialog):
         return self.booking_combo.currentText()
 
     def get_check_out_datetime(self):
-        qdt = self.check_out_datetime_edit.dateTime()
-        return datetime.fromtimestamp(qdt.toMSecsSinceEpoch() / 1000)
+        return self.check_out_datetime_edit.dateTime().toPyDateTime()
 
     def get_checkout_reason(self):
         return self.reason_combo.currentText()